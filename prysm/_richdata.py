@@ -139,7 +139,9 @@ class RichData:
     @property
     def support(self):
         """Width of the domain."""
-        return max((self.support_x, self.support_y))
+        sx = self.support_x
+        sy = self.support_y
+        return sx if sx > sy else sy
 
     def copy(self):
         """Return a (deep) copy of this instance."""
@@ -330,6 +332,11 @@ class RichData:
         """
         data = self.data
         x, y = self.x, self.y
+        if x.ndim == 2:
+            # the grids are separable (same assumption as slices); the extent
+            # only needs one row/column, not a min/max pass over N^2 samples
+            x = x[0]
+            y = y[..., 0]
 
         from matplotlib.colors import PowerNorm, LogNorm
         fig, ax = share_fig_ax(fig, ax)
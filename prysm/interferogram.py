@@ -1,6 +1,16 @@
-"""tools to analyze interferometric data."""
+"""tools to analyze interferometric data.
+
+Performance notes: the phase statistics (pv/rms/Sa/std) and the
+scalar-by-array scalings in this module are memory-bound; they move far
+more bytes than they do arithmetic.  Optimizations that pay off there
+are fewer passes over the data (util.stats), in-place out= operations,
+and narrower dtypes (config.precision = 32 on contiguous data).  The
+fringe rendering is compute-bound on cos and leans on the backend's
+vectorized transcendental loops; see _fringe_kernel.
+"""
 import warnings
 import inspect
+import functools
 import random
 import math
 
@@ -22,11 +32,64 @@ from .coordinates import (
     optimize_xy_separable
 )
 from prysm.polynomials import lstsq, mode_1d_to_2d
-from .util import mean, rms, pv, Sa, std  # NOQA
+from .util import mean, rms, pv, Sa, std, stats  # NOQA
 from .wavelengths import HeNe
 from .plotting import share_fig_ax
 
 
+def _waves_per_nm(wavelength):
+    """Conversion factor from nm of OPD to waves at the given wavelength.
+
+    Parameters
+    ----------
+    wavelength : float
+        wavelength of light, microns
+
+    Returns
+    -------
+    float
+        multiplicative factor converting nm to waves
+
+    """
+    # 1e3 = um to nm
+    return 1 / (wavelength * 1e3)
+
+
+# valid spellings for window and filter types, built once instead of per call
+_WELCH_WINDOWS = frozenset(('welch',))
+_HANN_WINDOWS = frozenset(('hann', 'hanning'))
+_LOWPASS_TYPES = frozenset(('lp', 'lowpass'))
+_HIGHPASS_TYPES = frozenset(('hp', 'highpass'))
+_BANDPASS_TYPES = frozenset(('bp', 'bandpass'))
+_BANDREJECT_TYPES = frozenset(('br', 'bandreject'))
+
+
+@functools.lru_cache(maxsize=32)
+def _pixel_axis(n, dtype):
+    """1D axis of n pixel indices; cached and marked read-only, do not mutate.
+
+    Parameters
+    ----------
+    n : int
+        number of samples
+    dtype : numpy.dtype
+        data type of the axis
+
+    Returns
+    -------
+    numpy.ndarray
+        ndarray of shape (n,)
+
+    """
+    arr = np.arange(n, dtype=dtype)
+    try:
+        arr.setflags(write=False)
+    except AttributeError:
+        pass  # non-numpy backends need not support read-only arrays
+
+    return arr
+
+
 def _rmax_square_array(r):
     loc = list(r.shape)
     loc[1] = loc[1] // 2
@@ -36,6 +99,58 @@ def _rmax_square_array(r):
     return rmax
 
 
+def _fringe_kernel(data, wavelength, visibility, passes, tilt_waves):
+    """Compute a wrapped-phase fringe pattern, visibility * cos(2pi N phase).
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        phase data, units of nm
+    wavelength : float
+        wavelength of light, microns
+    visibility : float
+        fringe visibility
+    passes : float
+        number of passes
+    tilt_waves : tuple
+        (x, y) waves of tilt
+
+    Returns
+    -------
+    numpy.ndarray
+        fringe pattern, same shape as data
+
+    Notes
+    -----
+    deliberately a flat elementwise pass over a single buffer; the cos
+    dominates the runtime and is dispatched to the backend's vectorized
+    loops (numpy's own SIMD kernels, or e.g. a fused cupy kernel when the
+    backend is swapped through mathops)
+
+    the function is resolved through the module namespace at call time,
+    so users with extreme throughput needs may rebind
+    prysm.interferogram._fringe_kernel to an ahead-of-time compiled
+    drop-in with the same signature; prysm itself ships no compiled
+    extensions and pays no JIT warmup
+
+    """
+    k = 2 * math.pi * passes
+    # fold the nm => um => waves conversion and 2pi N into one scalar;
+    # the product is the only full-size temporary, updated in place below
+    out = data * (k * wavelength / 1e3)  # 1e3 = nm to um
+    tx, ty = tilt_waves
+    if tx != 0 or ty != 0:
+        # divide by two because -1 to 1 is 2 units PV, waves are "1" PV
+        yramp = np.linspace(-1, 1, data.shape[0]) * (k * ty / 2)
+        xramp = np.linspace(-1, 1, data.shape[1]) * (k * tx / 2)
+        out += yramp[:, np.newaxis]
+        out += xramp
+
+    np.cos(out, out=out)
+    out *= visibility
+    return out
+
+
 def fit_plane(x, y, z):
     """Fit a plane to data.
 
@@ -143,11 +258,11 @@ def make_window(signal, dx, which=None, alpha=4):
         if type(which) is str:
             # known window type
             wl = which.lower()
-            if wl == 'welch':
+            if wl in _WELCH_WINDOWS:
                 x, y = make_xy_grid(s, dx=dx)
                 r, _ = cart_to_polar(x, y)
                 which = window_2d_welch(r, alpha=alpha)
-            elif wl in ('hann', 'hanning'):
+            elif wl in _HANN_WINDOWS:
                 y, x = (np.hanning(N) for N in s)
                 which = np.outer(y, x)
             else:
@@ -185,12 +300,13 @@ def psd(height, dx, window=None):
     """
     window = make_window(height, dx, window)
     ft = fft.ifftshift(fft.fft2(fft.fftshift(height * window)))
-    psd = abs(ft)**2  # mag squared first as per GH_FFT
+    psd = abs(ft)
+    np.square(psd, out=psd)  # mag squared first as per GH_FFT; in place, abs output is owned
 
     fs = 1 / dx
     S2 = (window**2).sum()
     coef = S2 * fs * fs
-    psd /= coef
+    psd *= (1 / coef)  # scalar multiply is far cheaper than divide over the array
 
     ux = forward_ft_unit(dx, height.shape[1])
     uy = forward_ft_unit(dx, height.shape[0])
@@ -286,7 +402,7 @@ def window_2d_welch(r, alpha=8):
 
     """
     rmax = _rmax_square_array(r)
-    window = 1 - abs(r/rmax)**alpha
+    window = 1 - abs(r * (1 / rmax))**alpha
     return window
 
 
@@ -496,16 +612,16 @@ def hann2d(M, N):
 
     nn = np.hypot(n, m)
     N = min(N, M)
-    w = np.cos(np.pi/N * nn) ** 2
+    w = np.cos(math.pi/N * nn) ** 2
     w[nn > N // 2] = 0
     return w
 
 
 def ideal_lpf_iir2d(r, dx, fc_over_nyq):
     """Ideal impulse response of a 2D lowpass filter."""
-    c = np.pi * fc_over_nyq / dx
+    c = math.pi * fc_over_nyq / dx
     # fc/nyq^2 * pi = area of circle; /2 = jinc has peak of 1
-    return jinc(r*c) * (fc_over_nyq**2 * np.pi / 2)
+    return jinc(r*c) * (fc_over_nyq**2 * math.pi / 2)
 
 
 def designfilt2d(r, dx, fc, typ='lowpass'):
@@ -537,20 +653,20 @@ def designfilt2d(r, dx, fc, typ='lowpass'):
     w = hann2d(*r.shape)
     nyq = 1 / (2*dx)
     tl = typ.lower()
-    if tl in ('lp', 'lowpass'):
+    if tl in _LOWPASS_TYPES:
         fc_over_nyq = fc/nyq
         h = ideal_lpf_iir2d(r, dx, fc_over_nyq)
         hprime = w * h
         H = fft.fft2(hprime)
         H = abs(H)
-    elif tl in ('hp', 'highpass'):
+    elif tl in _HIGHPASS_TYPES:
         fc_over_nyq = fc/nyq
         h = ideal_lpf_iir2d(r, dx, fc_over_nyq)
         hprime = w * h
         H = fft.fft2(hprime)
         H = abs(H)
         H = 1 - H
-    elif tl in ('bp', 'bandpass'):
+    elif tl in _BANDPASS_TYPES:
         # bandpass is made by producing the transfer function of low and high pass,
         # then combining them
         hl = ideal_lpf_iir2d(r, dx, fc[0]/nyq)
@@ -563,7 +679,7 @@ def designfilt2d(r, dx, fc, typ='lowpass'):
         Hh = abs(Hh)
         Hh = 1 - Hh
         H = 1 - (Hh + Hl)
-    elif tl in ('br', 'bandreject'):
+    elif tl in _BANDREJECT_TYPES:
         hl = ideal_lpf_iir2d(r, dx, fc[0]/nyq)
         hh = ideal_lpf_iir2d(r, dx, fc[1]/nyq)
         hlp = hl * w  # h_low prime
@@ -574,6 +690,8 @@ def designfilt2d(r, dx, fc, typ='lowpass'):
         Hh = abs(Hh)
         Hh = 1 - Hh
         H = (Hh + Hl)
+    else:
+        raise ValueError('unknown filter type')
 
     return H
 
@@ -620,7 +738,9 @@ class Interferogram(RichData):
         Parameters
         ----------
         phase : numpy.ndarray
-            phase values, units of nm
+            phase values, units of nm.  Stored C-contiguous in the precision
+            specified by config.precision; float32 halves the memory traffic
+            of every whole-array operation when the user selects 32-bit mode
         dx : float
             sample spacing in mm; if zero the data has no lateral calibration
             (xy scale only "px", not mm)
@@ -643,6 +763,7 @@ class Interferogram(RichData):
                 if wavelength is not None:
                     wavelength *= 1e6  # m to um
 
+        phase = np.ascontiguousarray(phase, dtype=config.precision)
         super().__init__(data=phase, dx=dx, wavelength=wavelength)
         self.intensity = intensity
         self.meta = meta
@@ -671,6 +792,22 @@ class Interferogram(RichData):
         """Sa phase error.  DIN/ISO Sa."""
         return Sa(self.data)
 
+    @property
+    def stats(self):
+        """All basic statistics of the phase error in a single pass over the data.
+
+        Cheaper than reading several of the pv/rms/Sa/std properties, which
+        each mask the invalid (NaN) elements of the data anew.  Not cached,
+        since many methods of this class mutate the data in place.
+
+        Returns
+        -------
+        dict
+            dictionary with keys mean, pv, rms, Sa, std
+
+        """
+        return stats(self.data)
+
     @property
     def strehl(self):
         """Strehl ratio of the data, assuming it represents wavefront error."""
@@ -678,7 +815,7 @@ class Interferogram(RichData):
 
         # 1e3 um => nm, all units same
         wvl = self.wavelength * 1e3
-        prefix = (4 * np.pi / wvl**2)
+        prefix = (4 * math.pi / wvl**2)
         coef = std(self.data) ** 2
         return 1 - prefix * coef
 
@@ -761,7 +898,8 @@ class Interferogram(RichData):
 
     def crop(self):
         """Crop data to rectangle bounding non-NaN region."""
-        nans = np.isfinite(self.data)
+        data = self.data
+        nans = np.isfinite(data)
         nancols = np.any(nans, axis=0)
         nanrows = np.any(nans, axis=1)
 
@@ -771,24 +909,24 @@ class Interferogram(RichData):
             return self
 
         if (left == 0) and (right == 0):
-            lr = slice(0, self.data.shape[0])
+            lr = slice(0, data.shape[0])
         elif left == 0:
             lr = slice(-right)
         elif right == 0:
-            lr = slice(left, self.data.shape[0])
+            lr = slice(left, data.shape[0])
         else:
             lr = slice(left, -right)
 
         if (top == 0) and (bottom == 0):
-            tb = slice(0, self.data.shape[1])
+            tb = slice(0, data.shape[1])
         elif top == 0:
             tb = slice(-bottom)
         elif bottom == 0:
-            tb = slice(top, self.data.shape[1])
+            tb = slice(top, data.shape[1])
         else:
             tb = slice(top, -bottom)
 
-        self.data = self.data[lr, tb]
+        self.data = data[lr, tb]
         # now cropped data, need to adjust coords
         # do nothing if they have not been computed
         if self._x is not None:
@@ -843,7 +981,7 @@ class Interferogram(RichData):
 
     def strip_latcal(self):
         """Strip the lateral calibration and revert to pixels."""
-        self.y, self.x = (np.arange(s, dtype=config.precision) for s in self.shape)
+        self.y, self.x = (_pixel_axis(s, config.precision) for s in self.shape)
         self._latcaled = False
         return self
 
@@ -866,8 +1004,9 @@ class Interferogram(RichData):
         """
         self.strip_latcal()
         # sloppy to strip, but it is what it is
-        self.x *= plate_scale
-        self.y *= plate_scale
+        # not in-place; the pixel axes from strip_latcal are shared and read-only
+        self.x = self.x * plate_scale
+        self.y = self.y * plate_scale
         self.dx = plate_scale
         self._latcaled = True
         return self
@@ -890,16 +1029,17 @@ class Interferogram(RichData):
 
         """
         npx = value
+        data = self.data
 
-        if np.isnan(self.data[0, 0]):
+        if np.isnan(data[0, 0]):
             fill_val = np.nan
         else:
             fill_val = 0
 
-        s = self.shape
-        out = np.empty((s[0] + 2 * npx, s[1] + 2 * npx), dtype=self.data.dtype)
+        s = data.shape
+        out = np.empty((s[0] + 2 * npx, s[1] + 2 * npx), dtype=data.dtype)
         out[:, :] = fill_val
-        out[npx:-npx, npx:-npx] = self.data
+        out[npx:-npx, npx:-npx] = data
         self.data = out
 
         return self.latcal(self.dx)
@@ -954,8 +1094,8 @@ class Interferogram(RichData):
         """
         H = designfilt2d(self.r, self.dx, fc, typ)
         D = fft.fft2(self.data)
-        Dprime = D * H
-        dprime = fft.ifft2(Dprime)
+        D *= H  # D is owned by this function; filter in place, no Dprime temporary
+        dprime = fft.ifft2(D)
         self.data = dprime.real
 
     def bandlimited_rms(self, wllow=None, wlhigh=None, flow=None, fhigh=None):
@@ -1001,11 +1141,11 @@ class Interferogram(RichData):
         """
         # 1000/L vs 1/L, um to mm
         upper_limit = 1000 / wavelength
-        kernel = 4 * np.pi * np.cos(np.radians(incident_angle))
+        kernel = 4 * math.pi * np.cos(np.radians(incident_angle))
         kernel *= self.bandlimited_rms(upper_limit, None) / wavelength
         return 1 - np.exp(-kernel**2)
 
-    def interferogram(self, visibility=1, passes=2, tilt_waves=(0,0), interpolation=None, fig=None, ax=None):
+    def interferogram(self, visibility=1, passes=2, tilt_waves=(0,0), interpolation=None, im=None, fig=None, ax=None):
         """Create a picture of fringes.
 
         Parameters
@@ -1018,6 +1158,11 @@ class Interferogram(RichData):
             (x,y) waves of tilt to use for the interferogram
         interpolation : str, optional
             interpolation method, passed directly to matplotlib
+        im : matplotlib.image.AxesImage, optional
+            image artist from a previous call, e.g. ax.images[0]; if given the
+            fringe data is drawn into the existing artist instead of creating
+            a new image and colorbar, which is much faster when animating.
+            fig/ax and the styling arguments are ignored in this case
         fig : matplotlib.figure.Figure, optional
             Figure to draw plot in
         ax : matplotlib.axes.Axis
@@ -1025,23 +1170,25 @@ class Interferogram(RichData):
 
         Returns
         -------
+        matplotlib.image.AxesImage
+            if im was given, the same artist, updated
         fig : matplotlib.figure.Figure, optional
             Figure containing the plot
         ax : matplotlib.axes.Axis, optional:
             Axis containing the plot
 
         """
-        data = self.data
-        # divide by two because -1 to 1 is 2 units PV, waves are "1" PV
-        yramp = np.linspace(-1, 1, data.shape[0]) * (tilt_waves[1] / 2)
-        xramp = np.linspace(-1, 1, data.shape[1]) * (tilt_waves[0] / 2)
-        yramp = np.broadcast_to(yramp, reversed(data.shape)).T
-        xramp = np.broadcast_to(xramp, data.shape)
-        phase = self.data / 1e3 * self.wavelength  # 1e3 = nm to um
-        phase = phase + (xramp + yramp)
+        plotdata = _fringe_kernel(self.data, self.wavelength, visibility, passes, tilt_waves)
+        if im is not None:
+            im.set_data(plotdata)
+            return im
+
         fig, ax = share_fig_ax(fig, ax)
-        plotdata = visibility * np.cos(2 * np.pi * passes * phase)
         x, y = self.x, self.y
+        if x.ndim == 2:
+            # separable grids; extent needs one row/column, not the whole array
+            x = x[0]
+            y = y[..., 0]
         im = ax.imshow(plotdata,
                        extent=[x.min(), x.max(), y.min(), y.max()],
                        cmap='gray',
@@ -1060,7 +1207,7 @@ class Interferogram(RichData):
             where to save to
 
         """
-        sf = 1 / (self.wavelength * 1e3)
+        sf = _waves_per_nm(self.wavelength)
         phase = self.data * sf
         write_zygo_ascii(file, phase=phase, dx=self.dx, intensity=None, wavelength=self.wavelength)
 
@@ -1071,9 +1218,10 @@ class Interferogram(RichData):
         else:
             z_unit = 'px'
         diameter_y, diameter_x = self.support_y, self.support_x
+        statistics = self.stats
         return inspect.cleandoc(f"""Interferogram with:
                 Size: ({diameter_x:.3f}x{diameter_y:.3f}){z_unit}
-                {self.pv:.3f} PV, {self.rms:.3f} RMS nm""")
+                {statistics['pv']:.3f} PV, {statistics['rms']:.3f} RMS nm""")
 
     @staticmethod
     def from_zygo_dat(path, multi_intensity_action='first'):
@@ -678,10 +678,12 @@ def read_zygo_datx(file):
 
 ZYGO_INVALID_PHASE = 2147483640
 ZYGO_ENC = 'utf-8'  # may be ASCII, cp1252...
-ZYGO_PHASE_RES_FACTORS = {
-    0: 4096,
-    1: 32768,
-}
+# indexed by the phase_res metadata value; a flat table, not a dict,
+# so the lookup is a plain sequence index
+ZYGO_PHASE_RES_FACTORS = (
+    4096,   # phase_res 0
+    32768,  # phase_res 1
+)
 
 
 def read_zygo_dat(file, multi_intensity_action='first'):
@@ -713,11 +715,12 @@ def read_zygo_dat(file, multi_intensity_action='first'):
     header_len = meta['header']['size']
 
     intensity = np.frombuffer(contents, offset=header_len, count=ilen, dtype=np.uint16).reshape((ib, ih, iw))
-    if multi_intensity_action.lower() == 'avg':
+    mia = multi_intensity_action.lower()
+    if mia == 'avg':
         intensity = intensity.mean(axis=0)
-    elif multi_intensity_action.lower() == 'first':
+    elif mia == 'first':
         intensity = intensity[0]
-    elif multi_intensity_action.lower() == 'last':
+    elif mia == 'last':
         intensity = intensity[-1]
     else:
         raise ValueError(f'multi_intensity_action {multi_intensity_action} not among valid options of avg, first, last.')
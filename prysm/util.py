@@ -1,8 +1,15 @@
 """Utility functions."""
 from operator import itemgetter
 
+import numpy as truenp
+
 from .mathops import np
 
+try:
+    import numpy_rms
+except ImportError:
+    numpy_rms = None
+
 
 def mean(array):
     """Return the mean value of the valid elements of an array.
@@ -53,8 +60,22 @@ def rms(array):
     float
         RMS of the array
 
+    Notes
+    -----
+    if the optional numpy-rms package is installed, fully finite contiguous
+    float32 arrays are dispatched to its SIMD kernel
+
     """
     non_nan = np.isfinite(array)
+    if non_nan.all():
+        if (numpy_rms is not None
+                and isinstance(array, truenp.ndarray)
+                and array.dtype == truenp.float32
+                and array.flags['C_CONTIGUOUS']):
+            return float(numpy_rms.rms(array.reshape(-1), array.size)[0])
+
+        return np.sqrt((array ** 2).mean())
+
     return np.sqrt((array[non_nan] ** 2).mean())
 
 
@@ -97,6 +118,35 @@ def std(array):
     return ary.std()
 
 
+def stats(array):
+    """Return all of the main statistics of the valid elements of an array at once.
+
+    Masks the invalid (NaN) elements of the array a single time, instead of
+    once per statistic as the individual functions do.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        array of values
+
+    Returns
+    -------
+    dict
+        dictionary with keys mean, pv, rms, Sa, std
+
+    """
+    non_nan = np.isfinite(array)
+    ary = array[non_nan]
+    mean = ary.mean()
+    return {
+        'mean': mean,
+        'pv': ary.max() - ary.min(),
+        'rms': np.sqrt((ary ** 2).mean()),
+        'Sa': abs(ary - mean).sum() / ary.size,
+        'std': ary.std(),
+    }
+
+
 def ecdf(x):
     """Compute the empirical cumulative distribution function of a dataset.
 
@@ -114,7 +164,7 @@ def ecdf(x):
 
     """
     xs = np.sort(x)
-    ys = np.arange(1, len(xs) + 1) / float(len(xs))
+    ys = np.arange(1, len(xs) + 1) * (1 / len(xs))
     return xs, ys
 
 
@@ -85,6 +85,15 @@ def test_descale_latcal_ok(sample_i_mutate):
     assert pytest.approx(plate_scale, sample_i_mutate.dx, abs=1e-8)
 
 
+def test_strip_latcal_then_latcal_functions():
+    z = np.random.rand(16, 16)
+    i = Interferogram(z, dx=1)
+    i.strip_latcal()
+    i.latcal(0.5)
+    assert i.dx == pytest.approx(0.5)
+    assert i.x[1] == pytest.approx(0.5)
+
+
 def test_make_window_passes_array():
     win = signal = np.empty((2, 2))
     win2 = make_window(signal, 1, win)
@@ -178,3 +187,12 @@ def test_interferogram_functions(sample_i_mutate):
     fig, ax = sample_i_mutate.interferogram()
     assert fig
     assert ax
+
+
+def test_interferogram_reuses_image_artist():
+    z = np.random.rand(16, 16)
+    i = Interferogram(z, dx=1)
+    fig, ax = i.interferogram()
+    im = ax.images[0]
+    im2 = i.interferogram(tilt_waves=(1, 1), im=im)
+    assert im2 is im
@@ -14,6 +14,11 @@ def test_rms_is_zero_for_single_value_array():
     assert util.rms(arr) == pytest.approx(1)
 
 
+def test_rms_correct_for_float32_contiguous_array():
+    arr = np.ones((ARR_SIZE, ARR_SIZE), dtype=np.float32)
+    assert util.rms(arr) == pytest.approx(1)
+
+
 def test_ecdf_binary_distribution():
     x = np.asarray([0, 0, 0, 1, 1, 1])
     x, y = util.ecdf(x)
@@ -31,3 +36,14 @@ def test_sort_xy():
 def test_Sa_gives_correct_value():
     ary = np.array([1, 2, 3, 4, 5])
     assert util.Sa(ary) == 1.2
+
+
+def test_stats_matches_individual_functions():
+    ary = np.random.rand(ARR_SIZE, ARR_SIZE)
+    ary[0, 0] = np.nan
+    stats = util.stats(ary)
+    assert stats['mean'] == pytest.approx(util.mean(ary))
+    assert stats['pv'] == pytest.approx(util.pv(ary))
+    assert stats['rms'] == pytest.approx(util.rms(ary))
+    assert stats['Sa'] == pytest.approx(util.Sa(ary))
+    assert stats['std'] == pytest.approx(util.std(ary))